@@ -5,7 +5,7 @@ from typing import List, Optional
 # pylint: disable=no-member
 import pygame
 from pygame import SRCALPHA
-from pygame.locals import QUIT, MOUSEBUTTONDOWN
+from pygame.locals import QUIT, MOUSEBUTTONDOWN, VIDEOEXPOSE
 
 # Initialize pygame
 pygame.init()  # pylint: disable=no-member
@@ -16,7 +16,9 @@ BOARD_SIZE = 3
 CELL_SIZE = 120
 BOARD_OFFSET_X = (SCREEN_WIDTH - BOARD_SIZE * CELL_SIZE) // 2
 BOARD_OFFSET_Y = 100
+BOARD_PIXELS = BOARD_SIZE * CELL_SIZE
 PIECE_SIZES = [60, 40, 20]  # Large, Medium, Small radii
+PIECE_MARGIN = 2  # Padding around pre-rendered piece surfaces
 PIECE_COLORS = [(255, 0, 0), (255, 255, 0)]  # Red, Yellow
 BACKGROUND_COLOR = (240, 240, 240)
 GRID_COLOR = (50, 50, 50)
@@ -36,28 +38,49 @@ class Player(Enum):
     RED = 0
     YELLOW = 1
 
+# Players indexed by value, for mapping the current player index back to a Player
+PLAYERS = (Player.RED, Player.YELLOW)
+
 class Piece:
     '''Class for Pieces'''
     def __init__(self, player: Player, size: int):
         self.player = player
         self.size = size  # 0 for large, 1 for medium, 2 for small
+        self.radius = PIECE_SIZES[size]
         self.x = 0
         self.y = 0
+        self.bbox = (0, 0, 0, 0)  # (left, top, right, bottom) while in reserve
         self.on_board = False
-        self.visible = True
 
-    def draw(self, surface):
-        '''Draws the piece'''
-        radius = PIECE_SIZES[self.size]
-        color = PIECE_COLORS[self.player.value]
-        pygame.draw.circle(surface, color, (self.x, self.y), radius)
-        pygame.draw.circle(surface, GRID_COLOR, (self.x, self.y), radius, 2)
+    def blit_item(self, piece_surfaces: dict):
+        '''Return the (surface, position) pair that draws the piece'''
+        offset = self.radius + PIECE_MARGIN
+        return (piece_surfaces[(self.player.value, self.size)],
+                (self.x - offset, self.y - offset))
+
+def render_piece(player: Player, size: int) -> pygame.Surface:
+    '''Render a piece of the given player and size onto its own surface'''
+    radius = PIECE_SIZES[size]
+    center = radius + PIECE_MARGIN
+    piece_surface = pygame.Surface((2 * center, 2 * center), SRCALPHA)
+    pygame.draw.circle(piece_surface, PIECE_COLORS[player.value], (center, center), radius)
+    pygame.draw.circle(piece_surface, GRID_COLOR, (center, center), radius, 2)
+    return piece_surface
+
+# One pre-rendered surface per (player value, size); each game blits
+# display-format copies of these instead of redrawing circles
+PIECE_SURFACES = {(player.value, size): render_piece(player, size)
+                  for player in Player for size in range(len(PIECE_SIZES))}
 
 class Cell:
     '''Class for Cells'''
-    def __init__(self, row: int, col: int):
+    def __init__(self, row: int, col: int, board: 'Board'):
         self.row = row
         self.col = col
+        self.board = board
+        self.bit = 1 << (row * BOARD_SIZE + col)
+        # Winning lines (row, column and any diagonals) through this cell
+        self.lines = tuple(win for win in Board.WIN_MASKS if win & self.bit)
         self.x = BOARD_OFFSET_X + col * CELL_SIZE + CELL_SIZE // 2
         self.y = BOARD_OFFSET_Y + row * CELL_SIZE + CELL_SIZE // 2
         self.pieces: List[Piece] = []
@@ -67,20 +90,18 @@ class Cell:
         piece.x = self.x
         piece.y = self.y
         piece.on_board = True
-
-        for p in self.pieces:
-            p.visible = False
-
         self.pieces.append(piece)
-        piece.visible = True
+        self.board.set_owner(self.bit, piece.player)
 
     def remove_piece(self, piece: Piece):
-        '''Remove piece from the cell'''
-        if piece in self.pieces:
-            self.pieces.remove(piece)
-            # Update visibility of the top piece if any remain
+        '''Remove piece from the cell (only the top piece can be picked up)'''
+        if self.pieces and self.pieces[-1] is piece:
+            self.pieces.pop()
+            # Any piece left underneath is uncovered
             if self.pieces:
-                self.pieces[-1].visible = True
+                self.board.set_owner(self.bit, self.pieces[-1].player)
+            else:
+                self.board.set_owner(self.bit, None)
 
     def top_piece(self) -> Optional[Piece]:
         '''Return the topmost piece in the cell'''
@@ -93,111 +114,181 @@ class Cell:
         top = self.top_piece()
         return piece.size < top.size  # Can only gobble smaller pieces
 
-    def draw(self, surface):
-        '''Draws cell'''
+    def draw_outline(self, surface):
+        '''Draws cell border'''
         pygame.draw.rect(surface, GRID_COLOR, (
             BOARD_OFFSET_X + self.col * CELL_SIZE,
             BOARD_OFFSET_Y + self.row * CELL_SIZE,
             CELL_SIZE, CELL_SIZE
         ), 2)
-        for piece in self.pieces:
-            if piece.visible:
-                piece.draw(surface)
 
 class Board:
     '''Class for Board'''
+    # Rows, columns and diagonals as bitmasks over cell index row * BOARD_SIZE + col
+    WIN_MASKS = (0b000000111, 0b000111000, 0b111000000,
+                 0b001001001, 0b010010010, 0b100100100,
+                 0b100010001, 0b001010100)
+
     def __init__(self):
-        self.cells = [[Cell(row, col) for col in range(BOARD_SIZE)] for row in range(BOARD_SIZE)]
+        # Bit set where the player's piece is on top of the cell
+        self.red_mask = 0
+        self.yellow_mask = 0
+        self.cells = [[Cell(row, col, self) for col in range(BOARD_SIZE)]
+                      for row in range(BOARD_SIZE)]
+        # Row-major view of the same cells, for loops that don't need row/col
+        self.flat_cells = tuple(cell for row in self.cells for cell in row)
         self.history = []  # For rewind feature
 
+    def clear(self):
+        '''Empty every cell and the rewind history, keeping the cells'''
+        for cell in self.flat_cells:
+            cell.pieces.clear()
+        self.red_mask = 0
+        self.yellow_mask = 0
+        self.history.clear()
+
     def get_cell(self, row: int, col: int) -> Cell:
         '''Simply return cell at given row and column'''
         return self.cells[row][col]
 
     def get_cell_at_position(self, x: int, y: int) -> Optional[Cell]:
         '''Return the cell at the given position'''
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                cell_x = BOARD_OFFSET_X + col * CELL_SIZE
-                cell_y = BOARD_OFFSET_Y + row * CELL_SIZE
-                if (cell_x <= x < cell_x + CELL_SIZE and
-                    cell_y <= y < cell_y + CELL_SIZE):
-                    return self.get_cell(row, col)
+        dx = x - BOARD_OFFSET_X
+        dy = y - BOARD_OFFSET_Y
+        if 0 <= dx < BOARD_PIXELS and 0 <= dy < BOARD_PIXELS:
+            return self.cells[dy // CELL_SIZE][dx // CELL_SIZE]
         return None
 
-    def check_win(self, last_move_cell: Cell) -> Optional[Player]:
-        '''Check if the last move created a winning sequence'''
-
-        visible_pieces = []
-        for row in range(BOARD_SIZE):
-            row_pieces = []
-            for col in range(BOARD_SIZE):
-                cell = self.get_cell(row, col)
-                if cell.pieces and cell.pieces[-1].visible:
-                    row_pieces.append(cell.pieces[-1])
-                else:
-                    row_pieces.append(None)
-            visible_pieces.append(row_pieces)
-
-        # Check for 3 in a row for both players
-        for player in [Player.RED, Player.YELLOW]:
-            # Check rows
-            for row in range(BOARD_SIZE):
-                if all(piece and piece.player == player for piece in visible_pieces[row]):
-                    return player
+    def set_owner(self, bit: int, player: Optional[Player]):
+        '''Record which player (if any) shows the top piece of a cell'''
+        self.red_mask &= ~bit
+        self.yellow_mask &= ~bit
+        if player == Player.RED:
+            self.red_mask |= bit
+        elif player == Player.YELLOW:
+            self.yellow_mask |= bit
 
-            # Check columns
-            for col in range(BOARD_SIZE):
-                if all(visible_pieces[row][col] and visible_pieces[row][col].player == player
-                       for row in range(BOARD_SIZE)):
-                    return player
+    def check_win(self, last_move_cell: Cell, move_count: int,
+                  from_cell: Optional[Cell] = None) -> Optional[Player]:
+        '''Check if the last move created a winning sequence
 
-            # Check diagonals
-            if all(visible_pieces[i][i] and visible_pieces[i][i].player == player
-                   for i in range(BOARD_SIZE)):
-                return player
-            if all(visible_pieces[i][BOARD_SIZE-1-i] and
-                    visible_pieces[i][BOARD_SIZE-1-i].player == player
-                   for i in range(BOARD_SIZE)):
-                return player
-        return None
-    def draw(self, surface):
-        '''Draw board outline'''
+        Only lines through the cells whose top piece changed can have been
+        completed: the destination, and the cell the piece was lifted from.
+        '''
+        # Nobody can have three in a row before the fifth move
+        if move_count < 2 * BOARD_SIZE - 1:
+            return None
+        winner = None
+        for cell in (last_move_cell, from_cell):
+            if cell is None or not cell.pieces:
+                continue
+            player = cell.pieces[-1].player
+            mask = self.red_mask if player == Player.RED else self.yellow_mask
+            if any(mask & line == line for line in cell.lines):
+                # Red takes precedence if both players completed a line
+                if player == Player.RED:
+                    return player
+                winner = player
+        return winner
+    def render_static(self, surface):
+        '''Draw board outline and cell borders, which never change'''
         pygame.draw.rect(surface, GRID_COLOR, (
             BOARD_OFFSET_X, BOARD_OFFSET_Y,
             CELL_SIZE * BOARD_SIZE, CELL_SIZE * BOARD_SIZE
         ), 3)
 
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                self.get_cell(row, col).draw(surface)
+        for cell in self.flat_cells:
+            cell.draw_outline(surface)
+
+    def piece_blits(self, blit_list: list, piece_surfaces: dict):
+        '''Append blits for the top piece of each cell; the rest are covered'''
+        for cell in self.flat_cells:
+            if cell.pieces:
+                blit_list.append(cell.pieces[-1].blit_item(piece_surfaces))
 
     def save_state(self):
-        '''Save current board state for rewind feature'''
-        state = []
-        for row in range(BOARD_SIZE):
-            for col in range(BOARD_SIZE):
-                cell = self.get_cell(row, col)
-                state.append([{
-                    'player': piece.player.value,
-                    'size': piece.size,
-                    'visible': piece.visible
-                } for piece in cell.pieces])
-        self.history.append(state)
+        '''Save current board state for rewind feature
+
+        Each cell is stored as its stack height followed by one byte per
+        piece, bottom first: player << 2 | size.
+        '''
+        state = bytearray()
+        for cell in self.flat_cells:
+            state.append(len(cell.pieces))
+            state.extend((piece.player.value << 2) | piece.size for piece in cell.pieces)
+        self.history.append(bytes(state))
+
+    def restore_state(self, state: bytes, pieces: List[Piece]):
+        '''Restore a state from save_state, reusing the given pieces
+
+        Pieces that the state does not place are only marked off the board;
+        the caller must lay out the reserves again (GobbletGame.restore_state
+        does this).
+        '''
+        available = list(pieces)
+        for piece in available:
+            piece.on_board = False
+        index = 0
+        for cell in self.flat_cells:
+            cell.pieces.clear()
+            self.set_owner(cell.bit, None)
+            count = state[index]
+            index += 1
+            for code in state[index:index + count]:
+                player = Player(code >> 2)
+                size = code & 0b11
+                piece = next(p for p in available
+                             if p.player == player and p.size == size)
+                available.remove(piece)
+                cell.add_piece(piece)
+            index += count
 
 class GobbletGame:
     '''Class for Gobblet Game'''
     def __init__(self):
+        # Plain software window: display.update(rects) then copies only the
+        # dirty regions, which a renderer-backed (SCALED/OPENGL) window cannot do
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Gobblet Game")
-        self.clock = pygame.time.Clock()
+        # Drop events the game ignores (mouse motion etc.) before they reach Python
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([QUIT, MOUSEBUTTONDOWN, VIDEOEXPOSE])
+        # Display-format copies of the piece surfaces for faster blits
+        self.piece_surfaces = {key: piece_surface.convert_alpha()
+                               for key, piece_surface in PIECE_SURFACES.items()}
+        # Selection highlight for each piece size, drawn once
+        self.highlight_surfaces = []
+        for size_radius in PIECE_SIZES:
+            radius = size_radius + 5
+            highlight_surface = pygame.Surface((radius*2, radius*2), SRCALPHA)
+            pygame.draw.circle(highlight_surface, HIGHLIGHT_COLOR, (radius, radius), radius)
+            self.highlight_surfaces.append(highlight_surface.convert_alpha())
 
         # Initialize fonts properly
         self.font = pygame.font.Font(None, 36)
+        # Status text never changes, so render each message once
+        self.text_current = (
+            self.render_text("Current Player: RED", Player.RED, 30),
+            self.render_text("Current Player: YELLOW", Player.YELLOW, 30)
+        )
+        self.text_win = {
+            GameState.RED_WINS: self.render_text(
+                "RED WINS! Click to play again", Player.RED, 550),
+            GameState.YELLOW_WINS: self.render_text(
+                "YELLOW WINS! Click to play again", Player.YELLOW, 550)
+        }
+        self.text_current_rects = [text.get_rect(topleft=pos)
+                                   for text, pos in self.text_current]
 
         self.board = Board()
         self.state = GameState.PLAYING
-        self.current_player = Player.RED
+        self.current_player = Player.RED.value  # Index into PLAYERS
+        self.move_count = 0
+
+        # Pre-render the background and grid once, blitted every frame
+        self.board_bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.board_bg.fill(BACKGROUND_COLOR)
+        self.board.render_static(self.board_bg)
 
         # Initialize pieces for both players (2 of each size)
         self.reserve_pieces = {
@@ -209,22 +300,49 @@ class GobbletGame:
             for size in range(3):  # 0=large, 1=medium, 2=small
                 for _ in range(2):  # 2 of each size
                     self.reserve_pieces[player].append(Piece(player, size))
+        # Reserve slot coordinates, indexed [player][size][i] for the i-th
+        # off-board piece of that size
+        self.reserve_slots = {}
+        for player in [Player.RED, Player.YELLOW]:
+            x_base = 50 if player == Player.RED else SCREEN_WIDTH - 50
+            y_base = 200
+            x_step = 20 if player == Player.YELLOW else -20
+            self.reserve_slots[player] = [
+                [(x_base + x_step * i, y_base + size * 70 + i * 40) for i in range(2)]
+                for size in range(3)
+            ]
         # Set initial positions for reserve pieces
         self.update_reserve_positions()
         self.selected_piece = None
         self.original_cell = None
+        # Screen areas changed since the last frame; the first frame is drawn whole
+        self.dirty_rects = []
+        self.full_update = True
+    def render_text(self, message: str, player: Player, y: int):
+        '''Render a message in the player's colour, centred horizontally at y'''
+        text = self.font.render(message, True, PIECE_COLORS[player.value]).convert_alpha()
+        return text, (SCREEN_WIDTH // 2 - text.get_width() // 2, y)
     def update_reserve_positions(self):
         '''Position pieces in the reserve areas on the left and right'''
-        for player in [Player.RED, Player.YELLOW]:
-            x_base = 50 if player == Player.RED else SCREEN_WIDTH - 50
-            y_base = 200
-            off_board_pieces = [p for p in self.reserve_pieces[player] if not p.on_board]
-            for size in range(3):
-                pieces_of_size = [p for p in off_board_pieces if p.size == size]
-                for i, piece in enumerate(pieces_of_size):
-                    offset = i * 40
-                    piece.x = x_base + (20 if player == Player.YELLOW else -20) * i
-                    piece.y = y_base + size * 70 + offset
+        for player, pieces in self.reserve_pieces.items():
+            slots = self.reserve_slots[player]
+            used = [0] * len(PIECE_SIZES)
+            for piece in pieces:
+                if not piece.on_board:
+                    piece.x, piece.y = slots[piece.size][used[piece.size]]
+                    used[piece.size] += 1
+                    piece.bbox = (piece.x - piece.radius, piece.y - piece.radius,
+                                  piece.x + piece.radius, piece.y + piece.radius)
+    def mark_piece_dirty(self, piece: Piece):
+        '''Queue the screen area of a piece and its highlight for update'''
+        radius = piece.radius + 5
+        self.dirty_rects.append(pygame.Rect(piece.x - radius, piece.y - radius,
+                                            radius * 2, radius * 2))
+    def mark_reserve_dirty(self, player: Player):
+        '''Queue the screen area of a player's off-board pieces for update'''
+        for piece in self.reserve_pieces[player]:
+            if not piece.on_board:
+                self.mark_piece_dirty(piece)
     def handle_click(self, x: int, y: int):
         '''Handle mouse click events'''
         if self.state != GameState.PLAYING:
@@ -232,6 +350,8 @@ class GobbletGame:
             return
         # Handle piece selection or placement
         if self.selected_piece:
+            # The highlight moves or disappears whatever happens next
+            self.mark_piece_dirty(self.selected_piece)
             # We have a piece selected, try to place it
             target_cell = self.board.get_cell_at_position(x, y)
             if target_cell:
@@ -246,20 +366,26 @@ class GobbletGame:
                     # Remove from original cell if on board
                     if self.original_cell:
                         self.original_cell.remove_piece(self.selected_piece)
+                    else:
+                        # Remaining reserve pieces may slide up
+                        self.mark_reserve_dirty(PLAYERS[self.current_player])
                     # Add to new cell
                     target_cell.add_piece(self.selected_piece)
+                    self.move_count += 1
+                    self.mark_piece_dirty(self.selected_piece)
+                    self.dirty_rects.extend(self.text_current_rects)
                     # Check for win condition
-                    winner = self.board.check_win(target_cell)
+                    winner = self.board.check_win(target_cell, self.move_count,
+                                                  self.original_cell)
                     if winner == Player.RED:
                         self.state = GameState.RED_WINS
+                        self.full_update = True
                     elif winner == Player.YELLOW:
                         self.state = GameState.YELLOW_WINS
+                        self.full_update = True
                     else:
                         # Switch players
-                        if self.current_player == Player.RED:
-                            self.current_player = Player.YELLOW
-                        else:
-                            self.current_player = Player.RED
+                        self.current_player ^= 1
                     # Reset selection
                     self.selected_piece = None
                     self.original_cell = None
@@ -273,79 +399,97 @@ class GobbletGame:
             # No piece selected yet, try to select one
             # First check board pieces
             cell = self.board.get_cell_at_position(x, y)
-            if cell and cell.pieces and cell.top_piece().player == self.current_player:
+            if cell and cell.pieces and cell.top_piece().player.value == self.current_player:
                 self.selected_piece = cell.top_piece()
                 self.original_cell = cell
+                self.mark_piece_dirty(self.selected_piece)
                 return
             # Then check reserve pieces
-            for piece in self.reserve_pieces[self.current_player]:
-                if (not piece.on_board and
-                    (piece.x-PIECE_SIZES[piece.size] <= x <= piece.x + PIECE_SIZES[piece.size]) and
-                    (piece.y-PIECE_SIZES[piece.size] <= y <= piece.y + PIECE_SIZES[piece.size])):
+            for piece in self.reserve_pieces[PLAYERS[self.current_player]]:
+                if piece.on_board:
+                    continue
+                left, top, right, bottom = piece.bbox
+                if left <= x <= right and top <= y <= bottom:
                     self.selected_piece = piece
                     self.original_cell = None
+                    self.mark_piece_dirty(piece)
                     return
+    def restore_state(self, state: bytes):
+        '''Restore a board snapshot and put the other pieces back in the reserves'''
+        self.board.restore_state(
+            state, self.reserve_pieces[Player.RED] + self.reserve_pieces[Player.YELLOW])
+        self.update_reserve_positions()
+        self.selected_piece = None
+        self.original_cell = None
+        self.full_update = True
     def reset_game(self):
         '''Reset the game state'''
-        self.board = Board()
+        self.board.clear()
         self.state = GameState.PLAYING
-        self.current_player = Player.RED
-        # Reset pieces
-        self.reserve_pieces = {
-            Player.RED: [],
-            Player.YELLOW: []
-        }
+        self.current_player = Player.RED.value  # Index into PLAYERS
+        self.move_count = 0
+        # Return the existing pieces to the reserves
         for player in [Player.RED, Player.YELLOW]:
-            for size in range(3):
-                for _ in range(2):
-                    self.reserve_pieces[player].append(Piece(player, size))
+            for piece in self.reserve_pieces[player]:
+                piece.on_board = False
         self.update_reserve_positions()
         self.selected_piece = None
         self.original_cell = None
+        self.full_update = True
     def draw(self):
         '''Draw the game state'''
-        self.screen.fill(BACKGROUND_COLOR)
-        # Draw the board
-        self.board.draw(self.screen)
+        # Collect every blit for the frame and submit them in one call
+        # Draw the background and grid, then the pieces on the board
+        blit_list = [(self.board_bg, (0, 0))]
+        self.board.piece_blits(blit_list, self.piece_surfaces)
         # Draw reserve pieces
         for player in [Player.RED, Player.YELLOW]:
             for piece in self.reserve_pieces[player]:
                 if not piece.on_board:
-                    piece.draw(self.screen)
+                    blit_list.append(piece.blit_item(self.piece_surfaces))
         # Draw highlight for selected piece
         if self.selected_piece:
-            radius = PIECE_SIZES[self.selected_piece.size] + 5
-            highlight_surface = pygame.Surface((radius*2, radius*2), SRCALPHA)
-            pygame.draw.circle(highlight_surface, HIGHLIGHT_COLOR, (radius, radius), radius)
+            radius = self.selected_piece.radius + 5
             xrad = self.selected_piece.x - radius
             yrad = self.selected_piece.y - radius
-            self.screen.blit(highlight_surface, (xrad , yrad))
+            blit_list.append((self.highlight_surfaces[self.selected_piece.size], (xrad, yrad)))
         # Draw current player indicator
-        color_name = "RED" if self.current_player == Player.RED else "YELLOW"
-        val = self.current_player.value
-        text = self.font.render(f"Current Player: {color_name}", True, PIECE_COLORS[val])
-        self.screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, 30))
-        if self.state == GameState.RED_WINS:
-            rval = Player.RED.value
-            text = self.font.render("RED WINS! Click to play again", True, PIECE_COLORS[rval])
-            self.screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, 550))
-        elif self.state == GameState.YELLOW_WINS:
-            yelval = Player.YELLOW.value
-            text = self.font.render("YELLOW WINS! Click to play again", True, PIECE_COLORS[yelval])
-            self.screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, 550))
+        blit_list.append(self.text_current[self.current_player])
+        if self.state in self.text_win:
+            blit_list.append(self.text_win[self.state])
+        self.screen.blits(blit_list, doreturn=False)
     def run(self):
         '''Main game loop'''
+        # Bind per-frame lookups to locals once, outside the loop
+        event_wait = pygame.event.wait
+        flip = pygame.display.flip
+        update = pygame.display.update
+        draw = self.draw
+        handle_click = self.handle_click
+        dirty_rects = self.dirty_rects
         running = True
         while running:
-            for event in pygame.event.get():
-                if event.type == QUIT:
-                    running = False
-                elif event.type == MOUSEBUTTONDOWN and event.button == 1:
-                    # Left mouse button clicked
-                    self.handle_click(*event.pos)
-            self.draw()
-            pygame.display.flip()
-            self.clock.tick(60)
+            # Redraw only when something changed; this also draws the first
+            # frame before blocking, since full_update starts out True
+            if self.full_update:
+                draw()
+                flip()
+                self.full_update = False
+            elif dirty_rects:
+                draw()
+                update(dirty_rects)
+            dirty_rects.clear()
+            # Nothing animates, so sleep until the next event arrives
+            event = event_wait()
+            event_type = event.type
+            if event_type == QUIT:
+                running = False
+            elif event_type == MOUSEBUTTONDOWN and event.button == 1:
+                # Left mouse button clicked
+                handle_click(*event.pos)
+            elif event_type == VIDEOEXPOSE:
+                # Window contents were lost, redraw all of it
+                self.full_update = True
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,59 @@
+'''Tests for the rewind snapshots'''
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# pylint: disable=wrong-import-position
+from gobbletgame import GobbletGame, Player
+
+
+def play_opening(game):
+    '''Place three pieces through the click handler'''
+    for x, y in [(50, 200), (400, 280),    # Red large to the centre
+                 (750, 200), (280, 160),   # Yellow large to the top left
+                 (50, 200), (520, 160)]:   # Red's other large to the top right
+        game.handle_click(x, y)
+
+
+def layout(game):
+    '''Positions and reserve bounding boxes of every piece
+
+    Pieces of the same player and size are interchangeable, so the result
+    is sorted rather than tied to particular Piece objects.
+    '''
+    return sorted((piece.player.value, piece.size, piece.on_board, piece.x, piece.y,
+                   None if piece.on_board else piece.bbox)
+                  for player in (Player.RED, Player.YELLOW)
+                  for piece in game.reserve_pieces[player])
+
+
+def test_save_restore_round_trip():
+    '''Restoring a snapshot rebuilds the same board and reserve layout'''
+    game = GobbletGame()
+    play_opening(game)
+    game.board.save_state()
+    snapshot = game.board.history[-1]
+    masks = (game.board.red_mask, game.board.yellow_mask)
+    expected_layout = layout(game)
+
+    game.reset_game()
+    game.restore_state(snapshot)
+
+    game.board.save_state()
+    assert game.board.history[-1] == snapshot
+    assert (game.board.red_mask, game.board.yellow_mask) == masks
+    assert layout(game) == expected_layout
+
+
+def test_restore_returns_pieces_to_reserve():
+    '''Pieces left off by a snapshot go back to their reserve slots'''
+    game = GobbletGame()
+    game.board.save_state()
+    empty = game.board.history[-1]
+    start_layout = layout(game)
+
+    play_opening(game)
+    game.restore_state(empty)
+
+    assert layout(game) == start_layout
+    assert game.board.red_mask == game.board.yellow_mask == 0